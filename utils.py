@@ -17,13 +17,77 @@
 # ==================================================================================================
 
 # Loading Packages
+import copy
+import functools
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import seaborn as sns
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 from IPython.display import HTML
 import yaml
 
+# Prefer the LibYAML C loader, which parses considerably faster than the pure-Python loader
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# orjson parses API responses considerably faster than the standard library when available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(content):
+    """
+    Parses a JSON response body, using orjson when it is installed.
+
+    Args:
+    - content (bytes): Raw response body.
+
+    Returns:
+    - Parsed JSON data.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # orjson is strict about non-standard values such as NaN, which json accepts
+            pass
+    return json.loads(content)
+
+# Shared HTTP session so repeated calls to the Design Tool API reuse keep-alive connections
+REQUEST_TIMEOUT = 30
+# Number of concurrent API requests; must not exceed the adapter's pool_maxsize
+MAX_WORKERS = 16
+
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32,
+                       max_retries=Retry(total=3, backoff_factor=0.3))
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+# Month names indexed by the API's zero-based issue_month0
+_MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+# Parsed configuration files keyed by path, stored as (mtime_ns, size, config)
+_CFG_CACHE = {}
+_CFG_LOCK = threading.Lock()
+
+# Administrative region tables keyed by the get_admin_data arguments
+_ADMIN_CACHE = {}
+_ADMIN_CACHE_SIZE = 128
+_ADMIN_LOCK = threading.Lock()
+
 
 def load_config(file_path="config.yaml"):
     """
@@ -35,15 +99,85 @@ def load_config(file_path="config.yaml"):
     Returns:
     - dict: Dictionary containing configuration data.
     """    
-    with open(file_path, "r") as file:
-        config = yaml.safe_load(file)
-    return config
+    # Reuse the parsed configuration while the file is unchanged
+    stat = os.stat(file_path)
+    key = os.path.abspath(file_path)
+    with _CFG_LOCK:
+        cached = _CFG_CACHE.get(key)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            # Return a copy so callers cannot modify the cached configuration
+            return copy.deepcopy(cached[2])
+
+        with open(file_path, "r") as file:
+            config = yaml.load(file, Loader=_YamlLoader)
+        _CFG_CACHE[key] = (stat.st_mtime_ns, stat.st_size, config)
+    return copy.deepcopy(config)
+
+def _flatten_record(record, prefix="", out=None):
+    """
+    Flattens a nested dictionary, joining nested keys with '_'.
+
+    Args:
+    - record (dict): Dictionary to flatten.
+    - prefix (str): Prefix prepended to every key.
+    - out (dict): Dictionary the flattened keys are written to.
+
+    Returns:
+    - dict: Flat dictionary.
+    """
+    if out is None:
+        out = {}
+    for key, value in record.items():
+        if isinstance(value, dict):
+            _flatten_record(value, f"{prefix}{key}_", out)
+        else:
+            out[f"{prefix}{key}"] = value
+    return out
+
+def _flatten_json(json_data):
+    """
+    Flattens an API response in a single pass, equivalent to pd.json_normalize followed by
+    expanding every list-valued column.
+
+    Args:
+    - json_data (dict): Parsed JSON response.
+
+    Returns:
+    - tuple: (dict of non-nested values keyed with '.'-joined names,
+              dict of equal-length column lists built from the records in list values)
+    """
+    scalars = {}
+    record_lists = []
+
+    def walk(obj, prefix):
+        for key, value in obj.items():
+            name = f"{prefix}{key}"
+            if isinstance(value, dict):
+                walk(value, f"{name}.")
+            elif isinstance(value, list):
+                record_lists.append([_flatten_record(item) for item in value])
+            else:
+                scalars[name] = value
+
+    walk(json_data, "")
+
+    # Records may not share every key, and lists may differ in length; pad with None like concat would
+    n_rows = max((len(records) for records in record_lists), default=0)
+    columns = {}
+    for records in record_lists:
+        padding = [None] * (n_rows - len(records))
+        keys = dict.fromkeys(key for record in records for key in record)
+        for key in keys:
+            columns[key] = [record.get(key) for record in records] + padding
+
+    return scalars, columns
 
 def get_data(maproom, mode, region, season, predictor, predictand, year, bad_years,
-             issue_month0, freq, include_upcoming, threshold_protocol, username, password):
+             issue_month0, freq, include_upcoming, threshold_protocol, username, password, session=SESSION):
     """
     Retrieves data from an API endpoint and combines it into a DataFrame.
     ...
+    - session (requests.Session): Session used for the request. Defaults to the shared SESSION.
     """
     # Make a GET request to the API
     region_str = ",".join(map(str, region))  # Convert region values to a comma-separated string
@@ -58,27 +192,11 @@ def get_data(maproom, mode, region, season, predictor, predictand, year, bad_yea
                f"&issue_month0={issue_month0}&freq={freq}&severity=0&include_upcoming={include_upcoming}")
 
     auth = (username, password)
-    response = requests.get(api_url, auth=auth)
+    response = session.get(api_url, auth=auth, timeout=REQUEST_TIMEOUT)
 
     if response.status_code == 200:
-        json_data = response.json()
-        flattened_data = pd.json_normalize(json_data)
-
-        non_nested_columns = []
-
-        for column in flattened_data.columns:
-            if isinstance(flattened_data[column][0], list):
-                expanded_data = pd.json_normalize(flattened_data[column].explode(), sep='_')
-                flattened_data = pd.concat([flattened_data, expanded_data], axis=1)
-                flattened_data = flattened_data.drop(column, axis=1)
-            else:
-                non_nested_columns.append(column)
-
-        non_nested_df = flattened_data[non_nested_columns]
-        melted_non_nested_df = pd.DataFrame({
-            'Metric': non_nested_df.columns,
-            'Value': non_nested_df.iloc[0].values
-        })
+        json_data = _json_loads(response.content)
+        scalars, columns = _flatten_json(json_data)
 
         replace_values = {
             'threshold': 'Forecast Threshold',
@@ -88,18 +206,16 @@ def get_data(maproom, mode, region, season, predictor, predictand, year, bad_yea
             'skill.worthy_action': 'Worthy Action',
             'skill.worthy_inaction': 'Worthy Inaction'
         }
-        melted_non_nested_df['Metric'] = melted_non_nested_df['Metric'].replace(replace_values)
 
+        # Map the non-nested values to their metric names
+        metrics = {replace_values.get(column, column): value for column, value in scalars.items()}
 
-        # Convert melted_non_nested_df to a dictionary
-        melted_non_nested_dict = melted_non_nested_df.set_index('Metric')['Value'].to_dict()
-
-        # Convert flattened data to Pandas DataFrame
-        df = pd.DataFrame(flattened_data).drop(non_nested_df.columns, axis=1, errors='ignore')
-        df['Triggered'] = df[predictor] > melted_non_nested_dict['Forecast Threshold']
-        df['Trigger Difference'] = df[predictor] - melted_non_nested_dict['Forecast Threshold']
-        df['Adjusted Forecast Threshold'] = melted_non_nested_dict['Forecast Threshold'] + threshold_protocol
-        df['Triggered Adjusted'] = df[predictor] > melted_non_nested_dict['Forecast Threshold']
+        # Build the yearly DataFrame in one call; the non-nested values are already kept apart
+        df = pd.DataFrame(columns)
+        df['Triggered'] = df[predictor] > metrics['Forecast Threshold']
+        df['Trigger Difference'] = df[predictor] - metrics['Forecast Threshold']
+        df['Adjusted Forecast Threshold'] = metrics['Forecast Threshold'] + threshold_protocol
+        df['Triggered Adjusted'] = df[predictor] > metrics['Forecast Threshold']
         df.rename(columns={predictor: 'Forecast', 'year': 'Year'}, inplace=True)
 
         # Filter df based on the provided list of years
@@ -108,39 +224,20 @@ def get_data(maproom, mode, region, season, predictor, predictand, year, bad_yea
         # Select relevant columns including 'year', and no longer limiting the DataFrame to the first row
         df = df.loc[:, ['Year', 'Forecast', 'Trigger Difference', 'Triggered', 'Triggered Adjusted', 'Adjusted Forecast Threshold']]
 
-        # Combine df and melted_non_nested_df
-     
-        combined_df = df
-
-        melted_non_nested_df.set_index('Metric', inplace=True)
-
-        combined_df['Act in Vain'] = melted_non_nested_df.at['Act in Vain', 'Value']
-        combined_df['Fail to Act'] = melted_non_nested_df.at['Fail to Act', 'Value']
-        combined_df['Worthy Action'] = melted_non_nested_df.at['Worthy Action', 'Value']
-        combined_df['Worthy Inaction'] = melted_non_nested_df.at['Worthy Inaction', 'Value']
-        combined_df['Frequency (%)'] = f"{freq}%"
-        combined_df['Forecast Accuracy (%)'] = melted_non_nested_df.at['Forecast Accuracy', 'Value']
-        combined_df['Forecast Threshold'] = melted_non_nested_df.at['Forecast Threshold', 'Value']
-        combined_df['Threshold Protocol'] = f"{threshold_protocol}"
-
-        month_mapping = {
-            0: 'Jan',
-            1: 'Feb',
-            2: 'Mar',
-            3: 'Apr',
-            4: 'May',
-            5: 'Jun',
-            6: 'Jul',
-            7: 'Aug',
-            8: 'Sep',
-            9: 'Oct',
-            10: 'Nov',
-            11: 'Dec'
-        }
-
-        combined_df['Issue Month'] = issue_month0
-        combined_df['Issue Month'] = combined_df['Issue Month'].map(month_mapping)
-        combined_df['Design Tool URL'] = f"<a href='{tool_url}'>Design Tool Link</a>"
+        # Add every scalar column in a single assign instead of one insert per column; metric values
+        # are cast to float so they keep the float64 dtype they had as a row of the normalized frame
+        combined_df = df.assign(**{
+            'Act in Vain': np.float64(metrics['Act in Vain']),
+            'Fail to Act': np.float64(metrics['Fail to Act']),
+            'Worthy Action': np.float64(metrics['Worthy Action']),
+            'Worthy Inaction': np.float64(metrics['Worthy Inaction']),
+            'Frequency (%)': f"{freq}%",
+            'Forecast Accuracy (%)': np.float64(metrics['Forecast Accuracy']),
+            'Forecast Threshold': np.float64(metrics['Forecast Threshold']),
+            'Threshold Protocol': f"{threshold_protocol}",
+            'Issue Month': _MONTHS[issue_month0],
+            'Design Tool URL': f"<a href='{tool_url}'>Design Tool Link</a>",
+        })
 
         # Define the sequence of desired columns
         desired_columns = ['Year', 'Frequency (%)', 'Issue Month', 'Forecast', 'Forecast Threshold', 'Trigger Difference',
@@ -163,37 +260,77 @@ def get_data(maproom, mode, region, season, predictor, predictand, year, bad_yea
 
 
 
-def get_admin_data(maproom, level, username, password, need_valid_keys, valid_keys=None):
+def _admin_cache_key(maproom, level, username, password, need_valid_keys, valid_keys):
+    """
+    Builds the get_admin_data cache key.
+
+    Args:
+    - maproom, level, username, password, need_valid_keys, valid_keys: get_admin_data arguments.
+
+    Returns:
+    - tuple: Hashable cache key, or None if the arguments cannot be cached.
+    """
+    # Key on a digest of the credentials so the password is not kept in the cache
+    credentials = hashlib.sha256(f"{username}\0{password}".encode()).hexdigest()
+
+    # Accept any list-like of keys (list, set, array, Series) as well as scalars such as None
+    if valid_keys is not None and not isinstance(valid_keys, str):
+        try:
+            valid_keys = tuple(valid_keys)
+        except TypeError:
+            pass
+    cache_key = (maproom, level, credentials, need_valid_keys, valid_keys)
+    try:
+        hash(cache_key)
+    except TypeError:
+        return None
+    return cache_key
+
+
+def get_admin_data(maproom, level, username, password, need_valid_keys, valid_keys=None, session=SESSION):
     """
     Retrieves administrative data from an API endpoint.
 
     Args:
     - maproom (str): Maproom value.
     - level (str): Level of administrative data.
+    - session (requests.Session): Session used for the request. Defaults to the shared SESSION.
 
     Returns:
     - DataFrame: DataFrame containing administrative data.
     """
+    # Reuse region lists already fetched for the same request
+    cache_key = _admin_cache_key(maproom, level, username, password, need_valid_keys, valid_keys)
+    cached = None
+    if cache_key is not None:
+        with _ADMIN_LOCK:
+            cached = _ADMIN_CACHE.get(cache_key)
+    if cached is not None:
+        # Return a copy so callers cannot modify the cached DataFrame
+        return cached.copy()
+
     # Construct the API URL with the provided parameters
     api_url = f"http://iridl.ldeo.columbia.edu/fbfmaproom2/regions?country={maproom}&level={level}"
 
     # Make a GET request to the API
     if username and password:
         auth = (username, password)
-        response = requests.get(api_url, auth=auth)
+        response = session.get(api_url, auth=auth, timeout=REQUEST_TIMEOUT)
     else:
-        response = requests.get(api_url)
+        response = session.get(api_url, timeout=REQUEST_TIMEOUT)
 
     # Check if the request was successful (status code 200)
     if response.status_code == 200:
         # Parse the JSON data
-        json_data = response.json()
+        json_data = _json_loads(response.content)
 
         # Create a DataFrame from the JSON data
         df = pd.DataFrame(json_data)
 
-        # Extract "key" and "label" from the "regions" column
-        df[['key', 'label']] = df['regions'].apply(pd.Series)
+        # Extract "key" and "label" from the "regions" column in one call; this handles both
+        # {"key": ..., "label": ...} records and [key, label] pairs without a Series per row
+        regions = pd.DataFrame(df['regions'].tolist(), columns=['key', 'label'], index=df.index)
+        df = df.join(regions)
 
         # Filter keys if valid_keys is provided
         if level != 0:
@@ -203,16 +340,38 @@ def get_admin_data(maproom, level, username, password, need_valid_keys, valid_ke
         # Drop the original "regions" column if needed
         df = df.drop('regions', axis=1)
 
-        return df
+        if cache_key is not None:
+            with _ADMIN_LOCK:
+                # Evict the oldest entry once the cache is full
+                if len(_ADMIN_CACHE) >= _ADMIN_CACHE_SIZE:
+                    _ADMIN_CACHE.pop(next(iter(_ADMIN_CACHE)))
+                _ADMIN_CACHE[cache_key] = df
+        return df.copy()
     else:
         # Print an error message if the request was not successful
         print(f"Error: {response.status_code}")
         return None
 
 
+def _fetch_one(label, **kwargs):
+    """
+    Retrieves a single trigger table and labels it with its administrative name.
+
+    Args:
+    - label (str): Administrative name inserted as the 'Admin Name' column.
+    - **kwargs: Keyword arguments passed through to get_data.
+
+    Returns:
+    - DataFrame: Trigger table for one frequency, issue month and region.
+    """
+    df = get_data(**kwargs)
+    df.insert(0, 'Admin Name', label)
+    return df
+
+
 def get_trigger_tables(maproom, mode, season, predictor, predictand, year, bad_years,
                        issue_month, frequencies, include_upcoming, threshold_protocol, username, password,
-                       need_valid_keys, valid_keys):
+                       need_valid_keys, valid_keys, session=None):
     """
     Retrieves trigger tables based on specified parameters.
 
@@ -230,11 +389,15 @@ def get_trigger_tables(maproom, mode, season, predictor, predictand, year, bad_y
     - password (str): Password for API authentication.
     - need_valid_keys (bool): Flag indicating if valid keys are needed.
     - valid_keys (list): List of valid keys.
+    - session (requests.Session): Session shared by all API calls. Defaults to the module SESSION.
 
     Returns:
     - dict: Dictionary containing trigger tables.
     """
     print("Fetching....")
+    if session is None:
+        session = SESSION
+
     # Initialize a dictionary to store admin tables
     admin_tables = {}
 
@@ -243,57 +406,81 @@ def get_trigger_tables(maproom, mode, season, predictor, predictand, year, bad_y
     admin_name = f"admin{mode}_tables"
     admin_tables[admin_name] = {}
     admin_data = get_admin_data(maproom, mode, username=username, password=password,
-                                need_valid_keys=need_valid_keys, valid_keys=valid_keys)
+                                need_valid_keys=need_valid_keys, valid_keys=valid_keys, session=session)
 
-    for freq in frequencies:
-        for month in issue_month:
-            # Iterate over each key value
+    # Collect the (key, label) pairs for every region
+    if isinstance(admin_data, pd.Series):
+        regions = list(admin_data.items())
+    elif isinstance(admin_data, pd.DataFrame):
+        regions = list(zip(admin_data['key'].to_numpy(), admin_data['label'].to_numpy()))
+    else:
+        # Handle other cases or raise an error
+        raise ValueError("Unexpected output type from get_admin_data.")
+
+    # Build every (freq, month, region_key, label) request up front. Each region needs its own request:
+    # the export endpoint treats a comma-separated region list as one combined area and returns a
+    # single aggregated result rather than one result per region
+    requests_to_fetch = [(freq, month, region_key, label)
+                         for freq in frequencies
+                         for month in issue_month
+                         for region_key, label in regions]
+
+    # The requests are independent and network-bound, so fetch them concurrently
+    results = {}
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {}
+        for freq, month, region_key, label in requests_to_fetch:
             if isinstance(admin_data, pd.Series):
-                for region_key, label in admin_data.items():
-                    print(region_key, label)
-                    table_name = f"output_freq_{freq}_mode_{mode}_month_{month}_region_{region_key}_table"
-
-                    df = get_data(maproom=maproom, mode=mode, region=[region_key],
-                                  season=season, predictor=predictor, predictand=predictand, year = year,
-                                  issue_month0=month, freq=freq, include_upcoming=include_upcoming,
-                                  bad_years = bad_years,
-                                  threshold_protocol=threshold_protocol, username=username, password=password)
-
-                    df.insert(0, 'Admin Name', label)
-                    admin_tables[admin_name][table_name] = df
-
-            elif isinstance(admin_data, pd.DataFrame):
-                for index, row in admin_data.iterrows():
-                    region_key, label = row['key'], row['label']
-
-                    table_name = f"output_freq_{freq}_mode_{mode}_month_{month}_region_{region_key}_table"
-
-                    df = get_data(maproom=maproom, mode=mode, region=[region_key],
-                                  season=season, predictor=predictor, predictand=predictand, year = year,
-                                  issue_month0=month, freq=freq, include_upcoming=include_upcoming,
-                                  bad_years = bad_years,
-                                  threshold_protocol=threshold_protocol, username=username, password=password)
+                print(region_key, label)
+            table_name = f"output_freq_{freq}_mode_{mode}_month_{month}_region_{region_key}_table"
+            future = executor.submit(_fetch_one, label, maproom=maproom, mode=mode, region=[region_key],
+                                     season=season, predictor=predictor, predictand=predictand, year=year,
+                                     issue_month0=month, freq=freq, include_upcoming=include_upcoming,
+                                     bad_years=bad_years,
+                                     threshold_protocol=threshold_protocol, username=username, password=password,
+                                     session=session)
+            futures[future] = table_name
 
-                    df.insert(0, 'Admin Name', label)
-                    admin_tables[admin_name][table_name] = df
-
-            else:
-                # Handle other cases or raise an error
-                raise ValueError("Unexpected output type from get_admin_data.")
+        try:
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        except BaseException:
+            # Stop at the first failure instead of waiting for every queued request
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    # Store the repeated string columns as categoricals; every table shares the same categories
+    # so pd.concat over the tables keeps the categorical dtype
+    categorical_dtypes = {
+        'Admin Name': pd.CategoricalDtype(list(dict.fromkeys(label for region_key, label in regions))),
+        'Frequency (%)': pd.CategoricalDtype([f"{freq}%" for freq in dict.fromkeys(frequencies)], ordered=True),
+        'Issue Month': pd.CategoricalDtype([_MONTHS[month] for month in sorted(set(issue_month))]),
+    }
+
+    # Store the tables in request order so downstream concatenation stays deterministic
+    for table_name in futures.values():
+        df = results[table_name]
+        admin_tables[admin_name][table_name] = df.astype(
+            {column: dtype for column, dtype in categorical_dtypes.items() if column in df.columns})
 
     return admin_tables
 
+@functools.lru_cache(maxsize=32)
 def generate_colors(n):
     """
-    Generates a list of n distinct colors in HSL format.
+    Generates a tuple of n distinct colors in HSL format. Results are cached so the same
+    palette (and CSS) is reused for tables with the same number of unique values.
     
     Args:
         n (int): The number of distinct colors to generate.
         
     Returns:
-        List[str]: A list of colors.
+        Tuple[str]: A tuple of colors.
     """
-    return [f"hsl({int((360 / n) * i)}, 100%, 70%)" for i in range(n)]
+    if n == 0:
+        return ()
+    hues = (np.arange(n) * (360 / n)).astype(int)
+    return tuple(f"hsl({h}, 100%, 70%)" for h in hues)
 
 def style_and_render_df_with_hyperlinks(df):
     # Define columns to style
@@ -313,38 +500,28 @@ def style_and_render_df_with_hyperlinks(df):
         color_maps[column] = {value: unique_colors[color_index + i] for i, value in enumerate(unique_values)}
         color_index += len(unique_values)
     
-    # Function to apply colors based on the value for a given column
-    def apply_color(val, column):
-        if pd.isnull(val):
-            return ''  # Return default style for NaN values
-        return f'background-color: {color_maps[column].get(val, "")};'
-    
     # Initialize the styled DataFrame
     styled_df = df.style
     
-    # Apply the styles to each column individually
+    # Apply the styles to each column with one precomputed array of CSS per column
     for column in columns_to_style:
-        styled_df = styled_df.map(lambda val, col=column: apply_color(val, col), subset=[column])
+        colors = df[column].astype(object).map(color_maps[column])
+        has_color = df[column].notna().to_numpy() & colors.notna().to_numpy()
+        styles = np.where(has_color, 'background-color: ' + colors.fillna('').astype(str) + ';', '')
+        styled_df = styled_df.apply(lambda s, styles=styles: styles, subset=[column])
     
     # Apply boolean highlights for 'triggered' and 'Triggered Adjusted' columns
     true_color, false_color = '#CCFFCC', '#FFCC99'
     
-    # Assuming styled_df is your DataFrame styled object, and true_color/false_color are defined
     columns_to_style = ['Triggered', 'Triggered Adjusted']
     
     for col in columns_to_style:
-        try:
-            # Check if column exists by trying to access it
-            if col in styled_df.columns:
-                # Apply the styling if column exists
-                styled_df = styled_df.map(lambda val: f'background-color: {true_color if val else false_color}', subset=[col])
-            else:
-                # If the column does not exist in the DataFrame, this line will not be executed
-                pass
-        except KeyError as e:
-            print(f"Column not found: {e}")
-            # Handle the case where the column does not exist, e.g., by logging or passing
+        # Skip columns that are not present in the DataFrame
+        if col not in df.columns:
             continue
+        styles = np.where(df[col].to_numpy().astype(bool),
+                          f'background-color: {true_color}', f'background-color: {false_color}')
+        styled_df = styled_df.apply(lambda s, styles=styles: styles, subset=[col])
     
     # Format numerical columns
     styled_df = styled_df.format({'Forecast': "{:.2f}", 'Trigger Difference': "{:.2f}", 'Forecast Accuracy (%)': "{:.2%}",'Forecast Threshold': "{:.2f}", 'Act in Vain': "{:.1f}", 'Fail to Act': "{:.1f}", 'Worthy Action': "{:.1f}", 'Worthy Inaction': "{:.1f}", 'Adjusted Forecast Threshold': "{:.2f}" })
@@ -363,20 +540,21 @@ def plot_triggered_events_admin0(data, season, severity):
     - severity (string): Severity Level
     """
     
-    # Group the data by the 'Year' and count the number of triggered events
-    yearly_triggered_count = data.groupby(['Year']).size().reset_index(name='Count of Triggered')
+    # Count the triggered events per year for each hue up front
+    counts_month = pd.crosstab(data['Year'], data['Issue Month'])
+    counts_freq = pd.crosstab(data['Year'], data['Frequency (%)'])
     
     # Set up a figure with two subplots side by side
     fig, axes = plt.subplots(1, 2, figsize=(18, 6))
     
-    # Count plot with 'Issue Month' as the hue
-    sns.countplot(data=data, x='Year', hue='Issue Month', ax=axes[0], dodge=True)
+    # Bar plot with 'Issue Month' as the hue
+    counts_month.plot.bar(ax=axes[0])
     axes[0].set_title(f'Triggered Events Frequency by Year and Issue Month - {season} {severity}')
     axes[0].set_xlabel('Year')
     axes[0].set_ylabel('Count of Triggered Events')
     
-    # Count plot with 'Frequency (%)' as the hue
-    sns.countplot(data=data, x='Year', hue='Frequency (%)', ax=axes[1], dodge=True)
+    # Bar plot with 'Frequency (%)' as the hue
+    counts_freq.plot.bar(ax=axes[1])
     axes[1].set_title(f'Triggered Events Frequency by Year and Frequency (%) - {season} {severity}')
     axes[1].set_xlabel('Year')
     axes[1].set_ylabel('Count of Triggered Events')
@@ -384,7 +562,19 @@ def plot_triggered_events_admin0(data, season, severity):
     plt.tight_layout()  # Adjust the layout to make sure everything fits without overlapping
     plt.show()
 
-def plot_triggered_events_heatmap_admin0(data, season, severity):
+def _triggered_pivot(data):
+    """
+    Counts events by frequency (rows) and issue month (columns).
+
+    Parameters:
+    - data: DataFrame containing 'Frequency (%)' and 'Issue Month' columns.
+
+    Returns:
+    - DataFrame: Event counts with missing combinations filled with 0.
+    """
+    return data.groupby(['Frequency (%)', 'Issue Month'], observed=True).size().unstack(fill_value=0)
+
+def plot_triggered_events_heatmap_admin0(data, season, severity, pivot=None):
     """
     Plots a heatmap of triggered events summarized by frequency and issue month.
 
@@ -392,19 +582,21 @@ def plot_triggered_events_heatmap_admin0(data, season, severity):
     - data: DataFrame containing 'Frequency (%)', 'Issue Month', and count of triggered events.
     - season (string): Target Season
     - severity (string): Severity Level
+    - pivot: Optional counts already computed with _triggered_pivot(data), reused instead of regrouping data.
     """
     # Summarize the counts by frequency and issue month
-    triggered_by_freq_month = data.groupby(['Frequency (%)', 'Issue Month']).size().unstack(fill_value=0)
+    if pivot is None:
+        pivot = _triggered_pivot(data)
     
     # Creating the heatmap
-    plt.figure(figsize=(10, 8))
-    heatmap = sns.heatmap(triggered_by_freq_month, annot=True, cmap="YlOrRd", fmt="d")
-    plt.title(f'Heatmap of Triggered Events - {season} {severity}')
-    plt.xlabel('Issue Month')
-    plt.ylabel('Frequency (%)')
+    fig, ax = plt.subplots(figsize=(10, 8))
+    heatmap = sns.heatmap(pivot, annot=True, cmap="YlOrRd", fmt="d", ax=ax)
+    ax.set_title(f'Heatmap of Triggered Events - {season} {severity}')
+    ax.set_xlabel('Issue Month')
+    ax.set_ylabel('Frequency (%)')
     
     plt.show()
-    plt.clf()  # Clear the figure to avoid overlap in subsequent plots
+    plt.close(fig)  # Release the figure so it does not accumulate in pyplot
 
 def plot_trigger_difference_boxplot_admin0(data, season, severity):
     """
@@ -439,25 +631,20 @@ def generate_heatmaps_for_admin1(data, season, severity):
     # Filter for triggered events
     triggered_events = data[data['Triggered']]
 
-    # Get unique admin names
-    admin_names = triggered_events['Admin Name'].unique()
-
-    for admin in admin_names:
-        # Filter the data for the current Admin Name
-        admin_triggered_events = triggered_events[triggered_events['Admin Name'] == admin]
-
+    # Split the triggered events by Admin Name in a single pass
+    for admin, admin_triggered_events in triggered_events.groupby('Admin Name', sort=False, observed=True):
         # Summarize the counts by frequency and issue month
-        admin_triggered_by_freq_month = admin_triggered_events.groupby(['Frequency (%)', 'Issue Month']).size().unstack(fill_value=0)
+        admin_triggered_by_freq_month = _triggered_pivot(admin_triggered_events)
 
         # Generate and display the heatmap
-        plt.figure(figsize=(10, 6))
-        heatmap = sns.heatmap(admin_triggered_by_freq_month, annot=True, cmap="BuPu", fmt="d")
+        fig, ax = plt.subplots(figsize=(10, 6))
+        heatmap = sns.heatmap(admin_triggered_by_freq_month, annot=True, cmap="BuPu", fmt="d", ax=ax)
         title = f'Heatmap of Triggered Events for {admin} - {season} {severity}'
-        plt.title(title)
-        plt.xlabel('Issue Month')
-        plt.ylabel('Frequency (%)')
+        ax.set_title(title)
+        ax.set_xlabel('Issue Month')
+        ax.set_ylabel('Frequency (%)')
         plt.show()
-        plt.clf()  # Clear the figure for the next iteration
+        plt.close(fig)  # Release the figure before the next iteration
 
 def plot_boxplots_and_quantiles_admin1(data, season, severity):
     """
@@ -468,20 +655,16 @@ def plot_boxplots_and_quantiles_admin1(data, season, severity):
     - season (string): Target Season
     - severity (string): Severity Level
     """
-    # Looping through each unique Admin Name
-    admin_names = data['Admin Name'].unique()
-    
-    for admin in admin_names:
-        # Filter the data for the current Admin Name
-        admin_data = data[data['Admin Name'] == admin]
-        
+    # Looping through each Admin Name, splitting the data in a single pass
+    for admin, admin_data in data.groupby('Admin Name', sort=False, observed=True):
         # Boxplot for Trigger Difference values for the current Admin Name
-        plt.figure(figsize=(10, 6))
-        sns.boxplot(x=admin_data['Trigger Difference'])
-        plt.title(f'Boxplot of Trigger Difference Values for {admin} - {season} {severity}')
-        plt.xlabel('Trigger Difference')
-        plt.grid(True)
+        fig, ax = plt.subplots(figsize=(10, 6))
+        sns.boxplot(x=admin_data['Trigger Difference'], ax=ax)
+        ax.set_title(f'Boxplot of Trigger Difference Values for {admin} - {season} {severity}')
+        ax.set_xlabel('Trigger Difference')
+        ax.grid(True)
         plt.show()
+        plt.close(fig)  # Release the figure before the next iteration
         
         # Calculate and display the quantile ranges for Trigger Difference values for the current Admin Name
         quantiles_admin = admin_data['Trigger Difference'].quantile([0, 0.25, 0.5, 0.75, 1]).to_dict()
@@ -537,43 +720,52 @@ def calculate_ev_rarop(dataframe, value_true_positive, cost_false_positive, valu
     - risk_tolerance: A numeric value indicating the tolerance for risk.
     
     Returns:
-    - A modified DataFrame with additional columns for 'EV', 'EV_norm', 'Risk', and 'RARoP'.
+    - A modified DataFrame with additional columns for 'EV', 'EV_norm', 'Risk', 'Reward', and 'RARoP'.
+
+    Raises:
+    - ValueError: If risk_tolerance is not between 0 and 1.
     """
 
+    # Work on NumPy arrays to avoid intermediate Series alignment
+    worthy_action = dataframe['Worthy Action'].to_numpy()
+    act_in_vain = dataframe['Act in Vain'].to_numpy()
+    worthy_inaction = dataframe['Worthy Inaction'].to_numpy()
+    fail_to_act = dataframe['Fail to Act'].to_numpy()
+
     # Calculate EV based on the provided values and costs
-    dataframe['EV'] = (
-        dataframe['Worthy Action'] * value_true_positive +
-        dataframe['Act in Vain'] * cost_false_positive +
-        dataframe['Worthy Inaction'] * value_true_negative +
-        dataframe['Fail to Act'] * cost_false_negative
+    ev = (
+        worthy_action * value_true_positive +
+        act_in_vain * cost_false_positive +
+        worthy_inaction * value_true_negative +
+        fail_to_act * cost_false_negative
     )
+    dataframe['EV'] = ev
 
     # Normalize EV to a 0-1 scale
     ev_min, ev_max = dataframe['EV'].min(), dataframe['EV'].max()
-    dataframe['EV_norm'] = (dataframe['EV'] - ev_min) / (ev_max - ev_min)
 
-    # Calculate Risk
-    dataframe['Risk'] = (dataframe['Act in Vain'] + dataframe['Fail to Act']) / (
-        dataframe['Worthy Action'] + dataframe['Act in Vain'] + dataframe['Worthy Inaction'] + dataframe['Fail to Act']
-    )
+    total = worthy_action + act_in_vain + worthy_inaction + fail_to_act
 
-    # Calculate Reward
-    dataframe['Reward'] = (dataframe['Worthy Action'] + dataframe['Worthy Inaction']) / (
-        dataframe['Worthy Action'] + dataframe['Act in Vain'] + dataframe['Worthy Inaction'] + dataframe['Fail to Act']
-    )
+    # Rows with no outcomes divide 0 by 0; keep the NaN results silent as Series division did
+    with np.errstate(divide='ignore', invalid='ignore'):
+        dataframe['EV_norm'] = (ev - ev_min) / (ev_max - ev_min)
+
+        # Calculate Risk
+        risk = (act_in_vain + fail_to_act) / total
+        dataframe['Risk'] = risk
+
+        # Calculate Reward
+        reward = (worthy_action + worthy_inaction) / total
+        dataframe['Reward'] = reward
+
+    # Calculate RARoP based on Reward and Risk; risk_tolerance is constant so branch once
+    if (risk_tolerance > 0) and (risk_tolerance <= 1):
+        dataframe['RARoP'] = reward - (risk / risk_tolerance)
+    elif risk_tolerance == 0:
+        dataframe['RARoP'] = reward - 10.0  # Penalty for risk when risk tolerance is 0
+    else:
+        raise ValueError('risk_tolerance is not between 0 and 1')
 
-    # Calculate RARoP based on EV_norm and Risk
-    def calculate_rarop(row):
-        if (risk_tolerance > 0) and (risk_tolerance <= 1):
-            return row['Reward'] - (row['Risk'] / risk_tolerance)
-        else:
-            if risk_tolerance == 0:
-                return row['Reward'] - 10  # Penalty for risk when risk tolerance is 0
-            else:
-                return print('risk_tolerance is not between 0 and 1')
-    
-    dataframe['RARoP'] = dataframe.apply(calculate_rarop, axis=1)
-    
     return dataframe
 
 def visualize_ev_rarop_by_admin(grouped_data):
@@ -655,34 +847,29 @@ def plot_metrics_by_admin_and_frequency(grouped_data):
     Returns:
     None. Displays a matplotlib graph for each 'Admin Name'.
     """
-    # Get unique admin names from the DataFrame
-    admin_names = grouped_data['Admin Name'].unique()
-
-    for admin in admin_names:
-        # Filter data for the current admin
-        admin_data = grouped_data[grouped_data['Admin Name'] == admin]
-
-        # Calculate metrics for the filtered admin data
-        admin_data['Accuracy'] = (
-            (admin_data['Worthy Action'] + admin_data['Worthy Inaction']) / 
-            (admin_data['Worthy Action'] + admin_data['Act in Vain'] + admin_data['Worthy Inaction'] + admin_data['Fail to Act'])
-        )
-
-        admin_data['Sensitivity'] = (
-            admin_data['Worthy Action'] / 
-            (admin_data['Worthy Action'] + admin_data['Fail to Act'])
-        )
-
-        admin_data['Specificity'] = (
-            admin_data['Worthy Inaction'] / 
-            (admin_data['Worthy Inaction'] + admin_data['Act in Vain'])
-        )
+    # Split the data by admin name in a single pass
+    for admin, admin_data in grouped_data.groupby('Admin Name', sort=False, observed=True):
+        # Extract the outcome arrays once for the filtered admin data
+        worthy_action = admin_data['Worthy Action'].to_numpy()
+        act_in_vain = admin_data['Act in Vain'].to_numpy()
+        worthy_inaction = admin_data['Worthy Inaction'].to_numpy()
+        fail_to_act = admin_data['Fail to Act'].to_numpy()
+
+        # Calculate metrics in NumPy and keep them in a small local DataFrame rather than
+        # writing new columns onto the group slice; 0/0 rows become NaN silently
+        with np.errstate(divide='ignore', invalid='ignore'):
+            metrics = pd.DataFrame({
+                'Frequency (%)': admin_data['Frequency (%)'].array,
+                'Accuracy': (worthy_action + worthy_inaction) / (worthy_action + act_in_vain + worthy_inaction + fail_to_act),
+                'Sensitivity': worthy_action / (worthy_action + fail_to_act),
+                'Specificity': worthy_inaction / (worthy_inaction + act_in_vain),
+            })
 
         # Plot the metrics for the current admin
         plt.figure(figsize=(10, 6))
-        sns.lineplot(x='Frequency (%)', y='Accuracy', data=admin_data, marker='o', label='Accuracy')
-        sns.lineplot(x='Frequency (%)', y='Sensitivity', data=admin_data, marker='s', label='Sensitivity')
-        sns.lineplot(x='Frequency (%)', y='Specificity', data=admin_data, marker='^', label='Specificity')
+        sns.lineplot(x='Frequency (%)', y='Accuracy', data=metrics, marker='o', label='Accuracy')
+        sns.lineplot(x='Frequency (%)', y='Sensitivity', data=metrics, marker='s', label='Sensitivity')
+        sns.lineplot(x='Frequency (%)', y='Specificity', data=metrics, marker='^', label='Specificity')
 
         plt.title(f'Metrics vs Frequency for {admin}')
         plt.ylabel('Metric Value')